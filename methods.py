@@ -1,5 +1,6 @@
 import functools
-from typing import Callable
+import math
+from typing import Callable, Optional
 import numpy as np
 from prettytable import PrettyTable
 
@@ -7,7 +8,11 @@ from prettytable import PrettyTable
 def dichotomic_search(func: Callable[[np.float32], np.float32],
                       a: np.float32, b: np.float32,
                       eps: np.float32,
-                      l: np.float32
+                      l: np.float32,
+                      confidence: Optional[np.float32] = None,
+                      batch: np.integer = 8,
+                      max_samples: np.integer = 4096,
+                      dtype: type = np.float64
                       ) -> tuple[np.float32, np.integer, PrettyTable]:
     """
     Метод дихотомии.
@@ -16,25 +21,54 @@ def dichotomic_search(func: Callable[[np.float32], np.float32],
     величину 'eps' в обе стороны от середины интервала неопределенности.
 
     Args:
-        func (Callable[[np.float32], np.float32]): целевая функция f(x)
+        func (Callable[[np.float32], np.float32]): целевая функция f(x); \
+            в стохастическом режиме вызывается как func(x, n) и возвращает \
+            массив из n выборок f(x)
         a (np.float32): левая граница интервала неопределенности
         b (np.float32): правая граница интервала неопределенности
         eps (np.float32): константа различимости
         l (np.float32): конечная длина интервала
+        confidence (Optional[np.float32]): уровень доверия последовательного \
+            теста; если задан, то func(x, n) возвращает n выборок \
+            стохастической целевой функции (см. sequential_compare)
+        batch (np.integer): размер порции выборок в стохастическом режиме
+        max_samples (np.integer): предельное число выборок в одной точке
+        dtype (type): тип с плавающей точкой, в котором хранятся границы \
+            интервала, пробные точки и значения функции
 
     Returns:
-        tuple[np.float32, np.integer]: tuple[точка минимума, кол-во вызовов функции, таблица со значениями переменных на каждом шаге]
+        tuple[np.float32, np.integer]: tuple[точка минимума, кол-во вызовов функции (в стохастическом режиме - кол-во выборок), таблица со значениями переменных на каждом шаге]; \
+            в стохастическом режиме добавляется флаг того, что все \
+            сравнения достигли уровня доверия 'confidence' (иначе \
+            точность 'l' не гарантирована)
     """
     assert eps >= 0, "'eps' should not be negative"
     assert l >= 0, "'l' should not be negative"
     assert b > a, f"invalid interval [{a}, {b}]"
-
+    assert confidence is None or 0 < confidence < 1, \
+        "'confidence' should be in (0, 1)"
+    assert confidence is None or batch >= 2, "'batch' should be at least 2"
+    assert confidence is None or max_samples >= batch, \
+        "'max_samples' should not be less than 'batch'"
+    assert np.issubdtype(dtype, np.floating), "'dtype' should be floating"
+
+    dtype = np.dtype(dtype).type
+    a, b, eps, l = dtype(a), dtype(b), dtype(eps), dtype(l)
     assert l > 2 * eps, "l must be more than 2 eps"
 
+    # Разность пробных точек и длина интервала не могут быть меньше,
+    # чем позволяет разрешение 'dtype'
+    eps = max(eps, tolerance_floor(a, b, dtype))
+    l = max(l, 2 * eps + 8 * tolerance_floor(a, b, dtype))
+
     table = PrettyTable()
     table.field_names = ["k", "a", "b", "lm",  "mu", "f(lm)", "f(mu)"]
+    if confidence is not None:
+        table.add_column("resolved", [])
 
     func_calls = 0
+    # Все ли сравнения в стохастическом режиме достигли уровня доверия
+    resolved_all = True
 
     # Начальный этап
     k = 1
@@ -48,11 +82,22 @@ def dichotomic_search(func: Callable[[np.float32], np.float32],
         mu = (a + b) / 2 + eps
 
         # Шаг 2
-        f_lm = func(lm)
-        f_mu = func(mu)
-        func_calls += 2
-
-        table.add_row([k, a, b, lm, mu, f_lm, f_mu])
+        if confidence is None:
+            f_lm = dtype(func(lm))
+            f_mu = dtype(func(mu))
+            func_calls += 2
+        else:
+            s_lm, s_mu, samples, resolved = sequential_compare(
+                func, lm, mu, confidence=confidence,
+                batch=batch, max_samples=max_samples, dtype=dtype
+            )
+            f_lm = np.mean(s_lm)
+            f_mu = np.mean(s_mu)
+            func_calls += samples
+            resolved_all = resolved_all and resolved
+
+        table.add_row([k, a, b, lm, mu, f_lm, f_mu] +
+                      ([] if confidence is None else [resolved]))
 
         if f_lm < f_mu:
             # a = a
@@ -64,13 +109,19 @@ def dichotomic_search(func: Callable[[np.float32], np.float32],
         # Шаг 3
         k += 1
 
+    if confidence is not None:
+        return (a + b) / 2, func_calls, table, resolved_all
     return (a + b) / 2, func_calls, table
 
 
 def golden_search(func: Callable[[np.float32], np.float32],
                   a: np.float32, b: np.float32,
                   eps: np.float32,
-                  l: np.float32
+                  l: np.float32,
+                  confidence: Optional[np.float32] = None,
+                  batch: np.integer = 8,
+                  max_samples: np.integer = 4096,
+                  dtype: type = np.float64
                   ) -> tuple[np.float32, np.integer]:
     """
     Метод золотого сечения.
@@ -79,24 +130,51 @@ def golden_search(func: Callable[[np.float32], np.float32],
     внутренних точек предыдущей итерации.
 
     Args:
-        func (Callable[[np.float32], np.float32]): целевая функция f(x)
+        func (Callable[[np.float32], np.float32]): целевая функция f(x); \
+            в стохастическом режиме вызывается как func(x, n) и возвращает \
+            массив из n выборок f(x)
         a (np.float32): левая граница интервала неопределенности
         b (np.float32): правая граница интервала неопределенности
         eps (np.float32): константа различимости
         l (np.float32): конечная длина интервала
+        confidence (Optional[np.float32]): уровень доверия последовательного \
+            теста; если задан, то func(x, n) возвращает n выборок \
+            стохастической целевой функции (см. sequential_compare)
+        batch (np.integer): размер порции выборок в стохастическом режиме
+        max_samples (np.integer): предельное число выборок в одной точке
+        dtype (type): тип с плавающей точкой, в котором хранятся границы \
+            интервала, пробные точки и значения функции
 
     Returns:
-        tuple[np.float32, np.integer]: tuple[точка минимума, кол-во вызовов функции, таблица со значениями переменных на каждом шаге]
+        tuple[np.float32, np.integer]: tuple[точка минимума, кол-во вызовов функции (в стохастическом режиме - кол-во выборок), таблица со значениями переменных на каждом шаге]; \
+            в стохастическом режиме добавляется флаг того, что все \
+            сравнения достигли уровня доверия 'confidence' (иначе \
+            точность 'l' не гарантирована)
     """
     assert eps >= 0, "'eps' should not be negative"
     assert l >= 0, "'l' should not be negative"
     assert b > a, f"invalid interval [{a}, {b}]"
+    assert confidence is None or 0 < confidence < 1, \
+        "'confidence' should be in (0, 1)"
+    assert confidence is None or batch >= 2, "'batch' should be at least 2"
+    assert confidence is None or max_samples >= batch, \
+        "'max_samples' should not be less than 'batch'"
+    assert np.issubdtype(dtype, np.floating), "'dtype' should be floating"
+
+    dtype = np.dtype(dtype).type
+    a, b, eps, l = dtype(a), dtype(b), dtype(eps), dtype(l)
+    # Длина интервала не может быть меньше, чем позволяет разрешение 'dtype'
+    l = max(l, 8 * tolerance_floor(a, b, dtype))
 
     table = PrettyTable()
     table.field_names = ["k", "a", "b", "lm",  "mu", "f(lm)", "f(mu)"]
+    if confidence is not None:
+        table.add_column("resolved", [])
 
     func_calls = 0
-    alpha = (np.sqrt(5) - 1) / 2  # 0.61803...
+    # Все ли сравнения в стохастическом режиме достигли уровня доверия
+    resolved_all = True
+    alpha = dtype((np.sqrt(5) - 1) / 2)  # 0.61803...
 
     # Начальный этап
     k = 1
@@ -104,13 +182,33 @@ def golden_search(func: Callable[[np.float32], np.float32],
     lm = a + (1 - alpha) * (b - a)
     mu = a + alpha * (b - a)
 
-    f_lm = func(lm)
-    f_mu = func(mu)
-    func_calls += 2
+    if confidence is None:
+        f_lm = dtype(func(lm))
+        f_mu = dtype(func(mu))
+        func_calls += 2
+    else:
+        s_lm = np.asarray(func(lm, batch), dtype=dtype)
+        s_mu = np.asarray(func(mu, batch), dtype=dtype)
+        f_lm = np.mean(s_lm)
+        f_mu = np.mean(s_mu)
+        func_calls += 2 * batch
 
     # Основной этап
     while True:
-        table.add_row([k, a, b, lm, mu, f_lm, f_mu])
+        if confidence is not None and not b - a < l:
+            s_lm, s_mu, samples, resolved = sequential_compare(
+                func, lm, mu, s_lm, s_mu, confidence=confidence,
+                batch=batch, max_samples=max_samples, dtype=dtype
+            )
+            f_lm = np.mean(s_lm)
+            f_mu = np.mean(s_mu)
+            func_calls += samples
+            resolved_all = resolved_all and resolved
+
+        # На последней строке сравнения нет
+        table.add_row([k, a, b, lm, mu, f_lm, f_mu] +
+                      ([] if confidence is None else
+                       [resolved if not b - a < l else "-"]))
 
         # Шаг 1
         if b - a < l:
@@ -126,8 +224,14 @@ def golden_search(func: Callable[[np.float32], np.float32],
             f_lm = f_mu
 
             mu = a + alpha * (b - a)
-            f_mu = func(mu)
-            func_calls += 1
+            if confidence is None:
+                f_mu = dtype(func(mu))
+                func_calls += 1
+            else:
+                s_lm = s_mu
+                s_mu = np.asarray(func(mu, batch), dtype=dtype)
+                f_mu = np.mean(s_mu)
+                func_calls += batch
 
         # f_lm <= f_mu
         else:
@@ -140,19 +244,31 @@ def golden_search(func: Callable[[np.float32], np.float32],
             f_mu = f_lm
 
             lm = a + (1 - alpha) * (b - a)
-            f_lm = func(lm)
-            func_calls += 1
+            if confidence is None:
+                f_lm = dtype(func(lm))
+                func_calls += 1
+            else:
+                s_mu = s_lm
+                s_lm = np.asarray(func(lm, batch), dtype=dtype)
+                f_lm = np.mean(s_lm)
+                func_calls += batch
 
         # Шаг 4
         k += 1
 
+    if confidence is not None:
+        return (a + b) / 2, func_calls, table, resolved_all
     return (a + b) / 2, func_calls, table
 
 
 def fibonacci_search(func: Callable[[np.float32], np.float32],
                      a: np.float32, b: np.float32,
                      eps: np.float32,
-                     l: np.float32
+                     l: np.float32,
+                     confidence: Optional[np.float32] = None,
+                     batch: np.integer = 8,
+                     max_samples: np.integer = 4096,
+                     dtype: type = np.float64
                      ) -> tuple[np.float32, np.integer]:
     """
     Метод Фибоначчи.
@@ -162,23 +278,50 @@ def fibonacci_search(func: Callable[[np.float32], np.float32],
     последовательности Фибоначчи.
 
     Args:
-        func (Callable[[np.float32], np.float32]): целевая функция f(x)
+        func (Callable[[np.float32], np.float32]): целевая функция f(x); \
+            в стохастическом режиме вызывается как func(x, n) и возвращает \
+            массив из n выборок f(x)
         a (np.float32): левая граница интервала неопределенности
         b (np.float32): правая граница интервала неопределенности
         eps (np.float32): константа различимости
         l (np.float32): конечная длина интервала
+        confidence (Optional[np.float32]): уровень доверия последовательного \
+            теста; если задан, то func(x, n) возвращает n выборок \
+            стохастической целевой функции (см. sequential_compare)
+        batch (np.integer): размер порции выборок в стохастическом режиме
+        max_samples (np.integer): предельное число выборок в одной точке
+        dtype (type): тип с плавающей точкой, в котором хранятся границы \
+            интервала, пробные точки и значения функции
 
     Returns:
-        tuple[np.float32, np.integer]: tuple[точка минимума, кол-во вызовов функции, таблица со значениями переменных на каждом шаге]
+        tuple[np.float32, np.integer]: tuple[точка минимума, кол-во вызовов функции (в стохастическом режиме - кол-во выборок), таблица со значениями переменных на каждом шаге]; \
+            в стохастическом режиме добавляется флаг того, что все \
+            сравнения достигли уровня доверия 'confidence' (иначе \
+            точность 'l' не гарантирована)
     """
     assert eps > 0, "'eps' should not be negative"
     assert l > 0, "'l' should not be negative"
     assert b > a, f"invalid interval [{a}, {b}]"
+    assert confidence is None or 0 < confidence < 1, \
+        "'confidence' should be in (0, 1)"
+    assert confidence is None or batch >= 2, "'batch' should be at least 2"
+    assert confidence is None or max_samples >= batch, \
+        "'max_samples' should not be less than 'batch'"
+    assert np.issubdtype(dtype, np.floating), "'dtype' should be floating"
+
+    dtype = np.dtype(dtype).type
+    a, b, eps, l = dtype(a), dtype(b), dtype(eps), dtype(l)
+    # Длина интервала не может быть меньше, чем позволяет разрешение 'dtype'
+    l = max(l, 8 * tolerance_floor(a, b, dtype))
 
     table = PrettyTable()
     table.field_names = ["k", "a", "b", "lm",  "mu", "f(lm)", "f(mu)"]
+    if confidence is not None:
+        table.add_column("resolved", [])
 
     func_calls = 0
+    # Все ли сравнения в стохастическом режиме достигли уровня доверия
+    resolved_all = True
 
     # Начальный этап
     k = 1
@@ -191,18 +334,33 @@ def fibonacci_search(func: Callable[[np.float32], np.float32],
         fib_n = fibonacci_of(n)
 
     # Подготовить массив с числами Фибоначи
-    fib: list[np.float32] = fibonacci_seq(n)
+    fib: np.ndarray = np.asarray(fibonacci_seq(n), dtype=dtype)
 
     lm = a + fib[n - 2] / fib[n] * (b - a)
     mu = a + fib[n - 1] / fib[n] * (b - a)
 
-    f_lm = func(lm)
-    f_mu = func(mu)
-    func_calls += 2
+    if confidence is None:
+        f_lm = dtype(func(lm))
+        f_mu = dtype(func(mu))
+        func_calls += 2
+    else:
+        s_lm = None
+        s_mu = None
 
     # Основной этап
     while True:
-        table.add_row([k, a, b, lm, mu, f_lm, f_mu])
+        if confidence is not None:
+            s_lm, s_mu, samples, resolved = sequential_compare(
+                func, lm, mu, s_lm, s_mu, confidence=confidence,
+                batch=batch, max_samples=max_samples, dtype=dtype
+            )
+            f_lm = np.mean(s_lm)
+            f_mu = np.mean(s_mu)
+            func_calls += samples
+            resolved_all = resolved_all and resolved
+
+        table.add_row([k, a, b, lm, mu, f_lm, f_mu] +
+                      ([] if confidence is None else [resolved]))
 
         # Шаг 1
         if f_lm > f_mu:
@@ -212,14 +370,19 @@ def fibonacci_search(func: Callable[[np.float32], np.float32],
             #  b = b
             lm = mu
             f_lm = f_mu
+            if confidence is not None:
+                s_lm = s_mu
 
             mu = a + fib[n - k - 1] / fib[n - k] * (b - a)
 
             if k == n - 2:
                 break
 
-            f_mu = func(mu)
-            func_calls += 1
+            if confidence is None:
+                f_mu = dtype(func(mu))
+                func_calls += 1
+            else:
+                s_mu = None
 
         # f_lm <= f_mu
         else:
@@ -229,14 +392,19 @@ def fibonacci_search(func: Callable[[np.float32], np.float32],
             b = mu
             mu = lm
             f_mu = f_lm
+            if confidence is not None:
+                s_mu = s_lm
 
             lm = a + fib[n - k - 2] / fib[n - k] * (b - a)
 
             if k == n - 2:
                 break
 
-            f_lm = func(lm)
-            func_calls += 1
+            if confidence is None:
+                f_lm = dtype(func(lm))
+                func_calls += 1
+            else:
+                s_lm = None
 
         # Шаг 4
         k += 1
@@ -248,10 +416,21 @@ def fibonacci_search(func: Callable[[np.float32], np.float32],
     mu = lm + eps
 
     # f_lm = func(lm)
-    f_mu = func(mu)
-    func_calls += 1
-
-    table.add_row([k, a, b, lm, mu, f_lm, f_mu])
+    if confidence is None:
+        f_mu = dtype(func(mu))
+        func_calls += 1
+    else:
+        s_lm, s_mu, samples, resolved = sequential_compare(
+            func, lm, mu, s_lm, confidence=confidence,
+            batch=batch, max_samples=max_samples, dtype=dtype
+        )
+        f_lm = np.mean(s_lm)
+        f_mu = np.mean(s_mu)
+        func_calls += samples
+        resolved_all = resolved_all and resolved
+
+    table.add_row([k, a, b, lm, mu, f_lm, f_mu] +
+                  ([] if confidence is None else [resolved]))
 
     if f_lm > f_mu:
         a = lm
@@ -260,9 +439,138 @@ def fibonacci_search(func: Callable[[np.float32], np.float32],
         # a = a
         b = lm
 
+    if confidence is not None:
+        return (a + b) / 2, func_calls, table, resolved_all
     return (a + b) / 2, func_calls, table
 
 
+def continuation_search(method: Callable,
+                        func: Callable[[np.float32, np.float32], np.float32],
+                        thetas: list[np.float32],
+                        a: np.float32, b: np.float32,
+                        eps: np.float32,
+                        l: np.float32,
+                        width: np.float32,
+                        dtype: type = np.float64
+                        ) -> tuple[list[np.float32], np.integer, np.integer, PrettyTable]:
+    """
+    Метод продолжения по параметру.
+    Идея метода состоит в последовательном поиске минимума семейства \
+    функций f(x; theta) для упорядоченной последовательности 'thetas'. \
+    Точка минимума для очередного theta предсказывается экстраполяцией \
+    по предыдущим решениям, вокруг нее строится небольшой интервал \
+    доверия, который расширяется в сторону убывания функции, пока не \
+    будет выполнено условие унимодальности f(lo) >= f(x) <= f(hi). \
+    Если интервал короче 'l', его середина принимается за решение, \
+    иначе внутри интервала запускается метод 'method'.
+
+    Args:
+        method (Callable): метод поиска (dichotomic_search, golden_search, fibonacci_search)
+        func (Callable[[np.float32, np.float32], np.float32]): целевая функция f(x, theta)
+        thetas (list[np.float32]): упорядоченная последовательность значений параметра
+        a (np.float32): левая граница исходного интервала неопределенности
+        b (np.float32): правая граница исходного интервала неопределенности
+        eps (np.float32): константа различимости
+        l (np.float32): конечная длина интервала
+        width (np.float32): полуширина интервала доверия, пока ошибка \
+            экстраполяции неизвестна
+        dtype (type): тип с плавающей точкой (см. golden_search)
+
+    Returns:
+        tuple[list[np.float32], np.integer, np.integer, PrettyTable]: tuple[точки минимума для каждого theta, кол-во вызовов функции, оценка кол-ва вызовов функции при запуске с исходного интервала, таблица со значениями переменных на каждом шаге]
+
+    Note:
+        Кол-во вызовов при запуске с исходного интервала не измеряется на \
+        целевой функции, а оценивается одним запуском метода на [a, b] \
+        с тождественной функцией: для всех трех методов оно зависит \
+        только от 'a', 'b', 'eps' и 'l'. Значения f(lo), f(x), f(hi), \
+        вычисленные при проверке унимодальности, методу не передаются, \
+        и он вычисляет значения внутри [lo, hi] заново.
+    """
+    assert width >= 2 * l, "'width' should be at least 2 l"
+    assert b > a, f"invalid interval [{a}, {b}]"
+
+    dtype = np.dtype(dtype).type
+    a, b = dtype(a), dtype(b)
+
+    table = PrettyTable()
+    table.field_names = ["theta", "a", "b", "x", "calls", "cold calls"]
+
+    func_calls = 0
+
+    # Кол-во вызовов метода зависит только от длины интервала, поэтому
+    # для запуска с исходного интервала оно вычисляется один раз
+    # на тождественной функции
+    cold = method(lambda x: x, a=a, b=b, eps=eps, l=l, dtype=dtype)[1]
+    cold_calls = cold * len(thetas)
+
+    xs: list[np.float32] = []
+    # Ошибка последней экстраполяции
+    error = None
+
+    for theta in thetas:
+        def f(x, theta=theta):
+            return func(x, theta)
+
+        if len(xs) == 0:
+            result, calls, _ = method(f, a=a, b=b, eps=eps, l=l, dtype=dtype)
+            xs.append(result)
+            func_calls += calls
+            table.add_row([theta, a, b, result, calls, cold])
+            continue
+
+        # Экстраполяция по не более чем трем предыдущим решениям
+        deg = min(len(xs), 3) - 1
+        coeffs = np.polyfit(thetas[len(xs) - deg - 1:len(xs)],
+                            xs[-deg - 1:], deg)
+        x = dtype(np.clip(np.polyval(coeffs, theta), a, b))
+        x_pred = x
+
+        # Полуширина интервала доверия по ошибке прошлого предсказания
+        w = width if error is None else max(error, l / 4)
+
+        lo, hi = max(a, x - w), min(b, x + w)
+        f_lo, f_x, f_hi = f(lo), f(x), f(hi)
+        calls = 3
+
+        # Проверка унимодальности f(lo) >= f(x) <= f(hi): если она не
+        # выполнена, интервал расширяется с удвоением шага в сторону
+        # убывания функции, каждое расширение стоит одного вызова
+        while f_lo < f_x and lo > a:
+            hi, f_hi = x, f_x
+            x, f_x = lo, f_lo
+            w *= 2
+            lo = max(a, x - w)
+            f_lo = f(lo)
+            calls += 1
+        while f_hi < f_x and hi < b:
+            lo, f_lo = x, f_x
+            x, f_x = hi, f_hi
+            w *= 2
+            hi = min(b, x + w)
+            f_hi = f(hi)
+            calls += 1
+
+        if hi - lo < l:
+            # Минимум уже локализован с требуемой точностью
+            result = (lo + hi) / 2
+        else:
+            # Метод Фибоначчи требует (hi - lo)/l >= 2
+            if hi - lo < 2 * l:
+                lo, hi = max(a, min(lo, hi - 2 * l)), min(b, max(hi, lo + 2 * l))
+            result, method_calls, _ = method(f, a=lo, b=hi, eps=eps, l=l,
+                                             dtype=dtype)
+            calls += method_calls
+
+        error = abs(result - x_pred)
+
+        xs.append(result)
+        func_calls += calls
+        table.add_row([theta, lo, hi, result, calls, cold])
+
+    return xs, func_calls, cold_calls, table
+
+
 @functools.cache
 def fibonacci_of(n: np.integer) -> np.integer:
     """Метод вычисления N-ого числа Фибоначчи
@@ -286,3 +594,179 @@ def fibonacci_seq(n: np.integer) -> list[np.integer]:
         list[np.integer]: лист с числами Фибоначчи от 0-ого до N-ого (включая N-ое)
     """
     return [fibonacci_of(i) for i in range(n + 1)]
+
+
+def tolerance_floor(a: np.float32, b: np.float32,
+                    dtype: type = np.float64) -> np.float32:
+    """Метод вычисления наименьшего различимого шага на интервале [a, b]
+
+    Args:
+        a (np.float32): левая граница интервала
+        b (np.float32): правая граница интервала
+        dtype (type): тип с плавающей точкой
+
+    Returns:
+        np.float32: машинный эпсилон 'dtype', масштабированный на max(|a|, |b|)
+    """
+    finfo = np.finfo(dtype)
+    return dtype(finfo.eps * max(abs(a), abs(b), finfo.tiny))
+
+
+def sequential_compare(func: Callable[[np.float32, np.integer], np.ndarray],
+                       lm: np.float32, mu: np.float32,
+                       s_lm: Optional[np.ndarray] = None,
+                       s_mu: Optional[np.ndarray] = None,
+                       confidence: np.float32 = 0.95,
+                       batch: np.integer = 8,
+                       max_samples: np.integer = 4096,
+                       dtype: type = np.float64
+                       ) -> tuple[np.ndarray, np.ndarray, np.integer, bool]:
+    """Последовательный тест для сравнения стохастической функции в двух точках.
+    Начиная с 'batch' выборок в каждой точке, число выборок в той точке, \
+    где среднее известно хуже, удваивается, пока разность выборочных \
+    средних не станет значимой по t-критерию Уэлча, либо пока в обеих \
+    точках не наберется 'max_samples' выборок. Из-за удвоения возможных \
+    проверок не больше 1 + 2 * ceil(log2(max_samples / batch)), и уровень \
+    значимости 1 - 'confidence' делится между ними поровну (поправка \
+    Бонферрони), поэтому вероятность неверного решения не превышает \
+    1 - 'confidence'.
+
+    Args:
+        func (Callable[[np.float32, np.integer], np.ndarray]): func(x, n) возвращает n выборок f(x)
+        lm (np.float32): первая точка
+        mu (np.float32): вторая точка
+        s_lm (Optional[np.ndarray]): уже имеющиеся выборки в точке 'lm'
+        s_mu (Optional[np.ndarray]): уже имеющиеся выборки в точке 'mu'
+        confidence (np.float32): уровень доверия теста
+        batch (np.integer): размер порции выборок
+        max_samples (np.integer): предельное число выборок в одной точке
+        dtype (type): тип с плавающей точкой для выборок
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.integer, bool]: tuple[выборки в 'lm', выборки в 'mu', кол-во новых выборок, достигнут ли уровень доверия]
+    """
+    assert 0 < confidence < 1, "'confidence' should be in (0, 1)"
+    assert batch >= 2, "'batch' should be at least 2"
+    assert max_samples >= batch, "'max_samples' should not be less than 'batch'"
+
+    # Каждая проверка, кроме первой, удваивает выборку в одной из точек
+    looks = 1 + 2 * int(np.ceil(np.log2(max_samples / batch)))
+    p = 1 - (1 - confidence) / looks / 2
+
+    s_lm = np.empty(0, dtype) if s_lm is None else np.asarray(s_lm, dtype)
+    s_mu = np.empty(0, dtype) if s_mu is None else np.asarray(s_mu, dtype)
+    samples = 0
+
+    while True:
+        # Дозапросить выборки в точках, где их меньше одной порции
+        if len(s_lm) < batch:
+            samples += batch - len(s_lm)
+            s_lm = np.append(s_lm, np.asarray(func(lm, batch - len(s_lm)), dtype))
+        if len(s_mu) < batch:
+            samples += batch - len(s_mu)
+            s_mu = np.append(s_mu, np.asarray(func(mu, batch - len(s_mu)), dtype))
+
+        diff = np.mean(s_lm) - np.mean(s_mu)
+        v_lm = np.var(s_lm, ddof=1) / len(s_lm)
+        v_mu = np.var(s_mu, ddof=1) / len(s_mu)
+        se = np.sqrt(v_lm + v_mu)
+
+        if se == 0:
+            return s_lm, s_mu, samples, True
+
+        # Число степеней свободы по формуле Уэлча-Саттертуэйта
+        df = (v_lm + v_mu) ** 2 / (
+            v_lm ** 2 / (len(s_lm) - 1) + v_mu ** 2 / (len(s_mu) - 1)
+        )
+        # Уменьшение df (округление вниз и ограничение сверху, где квантиль
+        # уже почти не меняется) дает более консервативный квантиль
+        t = student_t_quantile(p, min(math.floor(df), 200))
+        if abs(diff) > t * se:
+            return s_lm, s_mu, samples, True
+        if len(s_lm) >= max_samples and len(s_mu) >= max_samples:
+            return s_lm, s_mu, samples, False
+
+        # Удвоить выборку там, где среднее известно хуже
+        if len(s_mu) >= max_samples or (
+            len(s_lm) < max_samples and v_lm >= v_mu
+        ):
+            n = min(len(s_lm), max_samples - len(s_lm))
+            s_lm = np.append(s_lm, np.asarray(func(lm, n), dtype))
+        else:
+            n = min(len(s_mu), max_samples - len(s_mu))
+            s_mu = np.append(s_mu, np.asarray(func(mu, n), dtype))
+        samples += n
+
+
+def regularized_beta(x: np.float32, a: np.float32, b: np.float32) -> np.float32:
+    """Метод вычисления регуляризованной неполной бета-функции I_x(a, b) \
+    через цепную дробь (алгоритм Ленца)
+
+    Args:
+        x (np.float32): аргумент из [0, 1]
+        a (np.float32): первый параметр
+        b (np.float32): второй параметр
+
+    Returns:
+        np.float32: значение I_x(a, b)
+    """
+    if x <= 0 or x >= 1:
+        return 0.0 if x <= 0 else 1.0
+
+    # Для сходимости цепной дроби нужно x < (a + 1)/(a + b + 2)
+    if x > (a + 1) / (a + b + 2):
+        return 1 - regularized_beta(1 - x, b, a)
+
+    front = math.exp(
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) +
+        a * math.log(x) + b * math.log(1 - x)
+    ) / a
+
+    tiny = 1e-300
+    c, d = 1.0, 1 - (a + b) * x / (a + 1)
+    d = 1 / (d if abs(d) > tiny else tiny)
+    result = d
+    for m in range(1, 300):
+        for numerator in (
+            m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+            -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))
+        ):
+            d = 1 + numerator * d
+            d = 1 / (d if abs(d) > tiny else tiny)
+            c = 1 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            result *= c * d
+        if abs(c * d - 1) < 1e-15:
+            break
+
+    return front * result
+
+
+@functools.cache
+def student_t_quantile(p: np.float32, df: np.float32) -> np.float32:
+    """Метод вычисления квантиля распределения Стьюдента (p > 0.5) \
+    бисекцией по функции распределения
+
+    Args:
+        p (np.float32): уровень квантиля
+        df (np.float32): число степеней свободы (может быть дробным)
+
+    Returns:
+        np.float32: квантиль t_p(df)
+    """
+    assert 0.5 < p < 1, "'p' should be in (0.5, 1)"
+
+    # P(T > t) = I_{df/(df + t^2)}(df/2, 1/2) / 2
+    lo, hi = 0.0, 1.0
+    while regularized_beta(df / (df + hi * hi), df / 2, 0.5) / 2 > 1 - p:
+        hi *= 2
+    for _ in range(100):
+        t = (lo + hi) / 2
+        if regularized_beta(df / (df + t * t), df / 2, 0.5) / 2 > 1 - p:
+            lo = t
+        else:
+            hi = t
+        if hi - lo < 1e-10 * hi:
+            break
+
+    return (lo + hi) / 2
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 import main
 import methods
 
@@ -348,5 +350,175 @@ class TestMethods(unittest.TestCase):
         )
 
 
+class TestStochastic(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(42)
+        self.noisy = lambda x, n: (x - 1) ** 2 + self.rng.normal(0, 0.1, n)
+
+    def test_sequential_compare(self):
+        s_lm, s_mu, samples, resolved = methods.sequential_compare(
+            self.noisy, lm=-2, mu=1, confidence=0.99, batch=8
+        )
+        self.assertTrue(resolved)
+        self.assertEqual(samples, 16)
+        self.assertEqual(len(s_lm) + len(s_mu), samples)
+        self.assertGreater(np.mean(s_lm), np.mean(s_mu))
+
+        s_lm, s_mu, samples, resolved = methods.sequential_compare(
+            self.noisy, lm=0.999, mu=1.001, confidence=0.99,
+            batch=8, max_samples=64
+        )
+        self.assertFalse(resolved)
+        self.assertEqual(len(s_lm), 64)
+        self.assertEqual(len(s_mu), 64)
+        self.assertEqual(samples, 128)
+
+    def test_student_t_quantile(self):
+        self.assertAlmostEqual(methods.student_t_quantile(0.975, 1), 12.7062, 4)
+        self.assertAlmostEqual(methods.student_t_quantile(0.975, 7), 2.3646, 4)
+        self.assertAlmostEqual(methods.student_t_quantile(0.999, 14), 3.7874, 4)
+
+    def test_golden_table(self):
+        _, _, table, _ = methods.golden_search(
+            self.noisy, a=-3, b=5, eps=0.05, l=0.2, confidence=0.99
+        )
+        # Строка таблицы содержит средние, по которым принималось решение
+        for row, next_row in zip(table.rows, table.rows[1:]):
+            if row[5] > row[6]:
+                self.assertEqual(next_row[1], row[3])
+            else:
+                self.assertEqual(next_row[2], row[4])
+
+    def test_fixed_averaging(self):
+        # При том же числе выборок на точку, что и у усреднения по
+        # фиксированному N, последовательный тест дает ту же точность
+        # за меньшее число выборок
+        n = 1024
+        for method in (methods.dichotomic_search,
+                       methods.golden_search,
+                       methods.fibonacci_search):
+            self.rng = np.random.default_rng(0)
+            result, samples, _, _ = method(
+                self.noisy, a=-3, b=5, eps=0.1, l=0.5, confidence=0.95,
+                max_samples=n
+            )
+            self.rng = np.random.default_rng(0)
+            fixed_result, func_calls, _ = method(
+                lambda x: np.mean(self.noisy(x, n)),
+                a=-3, b=5, eps=0.1, l=0.5
+            )
+            self.assertAlmostEqual(result, 1.0, delta=0.5)
+            self.assertLessEqual(abs(result - 1), abs(fixed_result - 1) + 1e-9)
+            self.assertLess(2 * samples, func_calls * n)
+
+    def test_unresolved(self):
+        for method in (methods.dichotomic_search,
+                       methods.golden_search,
+                       methods.fibonacci_search):
+            _, samples, table, resolved = method(
+                self.noisy, a=-3, b=5, eps=0.0025, l=0.01, confidence=0.95,
+                max_samples=64
+            )
+            self.assertFalse(resolved)
+            self.assertIn(False, [row[-1] for row in table.rows])
+            self.assertLessEqual(samples, 2 * 64 * len(table.rows))
+
+    def test_validation(self):
+        calls = []
+
+        def sampler(x, n):
+            calls.append(n)
+            return self.noisy(x, n)
+
+        for method in (methods.dichotomic_search,
+                       methods.golden_search,
+                       methods.fibonacci_search):
+            with self.assertRaises(AssertionError):
+                method(sampler, a=-3, b=5, eps=0.05, l=0.2,
+                       confidence=0.95, batch=1)
+            with self.assertRaises(AssertionError):
+                method(sampler, a=-3, b=5, eps=0.05, l=0.2,
+                       confidence=0.95, batch=16, max_samples=8)
+        self.assertEqual(calls, [])
+
+
+class TestDtype(unittest.TestCase):
+    def setUp(self):
+        self.methods = (methods.dichotomic_search,
+                        methods.golden_search,
+                        methods.fibonacci_search)
+
+    def test_float32(self):
+        for method in self.methods:
+            result, _, table = method(
+                main.func2, a=0, b=3, eps=0.0001, l=0.001, dtype=np.float32
+            )
+            self.assertIsInstance(result, np.float32)
+            self.assertAlmostEqual(result, 1.0, delta=0.001)
+            for row in table.rows:
+                for value in row[1:]:
+                    self.assertIsInstance(value, np.float32)
+
+    def test_tolerance_floor(self):
+        self.assertEqual(
+            methods.tolerance_floor(-1, 2, np.float32),
+            2 * np.finfo(np.float32).eps
+        )
+        # Длина интервала меньше разрешения float32 - поиск должен завершиться
+        for method in self.methods:
+            result, _, _ = method(
+                lambda x: (x - 1) ** 2,
+                a=-3, b=5, eps=1e-10, l=1e-9, dtype=np.float32
+            )
+            self.assertAlmostEqual(result, 1.0, delta=1e-5)
+            result, _, _ = method(
+                lambda x: (x - 1e4) ** 2,
+                a=1e4 - 1, b=1e4 + 1, eps=1e-9, l=1e-8, dtype=np.float32
+            )
+            self.assertAlmostEqual(result, 1e4, delta=1e-2)
+
+
+class TestContinuation(unittest.TestCase):
+    def setUp(self):
+        self.family = lambda x, theta: (x - 2 * np.sin(theta)) ** 2
+        self.thetas = list(np.linspace(0, 3, 100))
+
+    def test_continuation(self):
+        for method in (methods.dichotomic_search,
+                       methods.golden_search,
+                       methods.fibonacci_search):
+            xs, func_calls, cold_calls, table = methods.continuation_search(
+                method, self.family, self.thetas,
+                a=-10, b=10, eps=0.0001, l=0.001, width=0.5
+            )
+            self.assertEqual(len(xs), len(self.thetas))
+            self.assertEqual(len(table.rows), len(self.thetas))
+            for x, theta in zip(xs, self.thetas):
+                self.assertAlmostEqual(x, 2 * np.sin(theta), delta=0.001)
+            self.assertLess(2.5 * func_calls, cold_calls)
+
+    def test_float32(self):
+        xs, _, _, table = methods.continuation_search(
+            methods.golden_search, self.family, self.thetas,
+            a=-10, b=10, eps=0.0001, l=0.001, width=0.5, dtype=np.float32
+        )
+        for x in xs:
+            self.assertIsInstance(x, np.float32)
+        for row in table.rows:
+            self.assertIsInstance(row[1], np.float32)
+            self.assertIsInstance(row[2], np.float32)
+
+    def test_widening(self):
+        # Скачок точки минимума: интервал доверия должен расшириться
+        xs, _, _, _ = methods.continuation_search(
+            methods.golden_search,
+            lambda x, theta: (x - (0 if theta < 2 else 5)) ** 2,
+            thetas=[0, 1, 2, 3],
+            a=-10, b=10, eps=0.001, l=0.01, width=0.5
+        )
+        self.assertAlmostEqual(xs[2], 5.0, delta=0.01)
+        self.assertAlmostEqual(xs[3], 5.0, delta=0.01)
+
+
 if __name__ == "__main__":
     unittest.main()